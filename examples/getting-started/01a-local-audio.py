@@ -49,4 +49,13 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Run on uvloop if it's installed, otherwise (e.g. on Windows) fall back to
+    # the default asyncio event loop. uvloop.new_event_loop() is available in
+    # every uvloop release, unlike uvloop.run().
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as loop_runner:
+            loop_runner.run(main())
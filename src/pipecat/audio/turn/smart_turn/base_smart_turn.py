@@ -28,6 +28,12 @@ STOP_SECS = 3
 PRE_SPEECH_MS = 500
 MAX_DURATION_SECONDS = 8  # Max allowed segment duration
 
+# Initial number of chunk entries tracked before the chunk arrays need to grow
+INITIAL_CHUNK_CAPACITY = 512
+
+# Scale factor to normalize int16 PCM samples to float32 in [-1, 1)
+INT16_TO_FLOAT32_SCALE = np.float32(1.0 / 32768.0)
+
 
 class SmartTurnParams(BaseTurnParams):
     """Configuration parameters for smart turn analysis.
@@ -67,15 +73,37 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         super().__init__(sample_rate=sample_rate)
         self._params = params or SmartTurnParams()
         # Configuration
-        self._stop_ms = self._params.stop_secs * 1000  # silence threshold in ms
-        # Inference state
-        self._audio_buffer = []
+        self._pre_speech_secs = self._params.pre_speech_ms / 1000
+        # Maximum audio kept in the buffer, in seconds
+        self._max_buffer_time = (
+            self._pre_speech_secs + self._params.stop_secs + self._params.max_duration_secs
+        )
+        # Computed once the sample rate is known
+        self._stop_samples = 0  # silence threshold in samples
+        self._max_samples = 0  # maximum segment length passed to the model
+        # Inference state. Audio is stored in a preallocated int16 ring buffer
+        # (sized in set_sample_rate) addressed by absolute sample positions.
+        # Each appended chunk is tracked by its timestamp and first sample
+        # position in parallel arrays, live between _chunk_head and _chunk_tail.
+        self._ring = np.zeros(0, dtype=np.int16)
+        self._ring_read = 0  # position of the oldest buffered sample
+        self._ring_write = 0  # position one past the newest buffered sample
+        self._chunk_times = np.zeros(INITIAL_CHUNK_CAPACITY, dtype=np.float64)
+        self._chunk_starts = np.zeros(INITIAL_CHUNK_CAPACITY, dtype=np.int64)
+        self._chunk_head = 0
+        self._chunk_tail = 0
+        # Preallocated float32 output for the segment passed to the model
+        self._segment_buffer = np.zeros(0, dtype=np.float32)
         self._speech_triggered = False
-        self._silence_ms = 0
+        self._silence_samples = 0
         self._speech_start_time = 0
-        # Thread executor that will run the model. We only need one thread per
-        # analyzer because one analyzer just handles one audio stream.
-        self._executor = ThreadPoolExecutor(max_workers=1)
+        # Thread executor that will run the model, keeping inference off the
+        # event loop. We only need one thread per analyzer because one analyzer
+        # just handles one audio stream, and analyze_end_of_turn() awaits each
+        # prediction, so segments never queue up behind a slow model.
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=f"{self.__class__.__name__}-inference"
+        )
         self._vad_start_secs: float = 0.0
 
     @property
@@ -96,6 +124,22 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         """
         return self._params
 
+    def set_sample_rate(self, sample_rate: int):
+        """Set the sample rate and allocate the audio ring buffer.
+
+        Args:
+            sample_rate: The sample rate to set.
+        """
+        super().set_sample_rate(sample_rate)
+        self._stop_samples = int(self._params.stop_secs * self._sample_rate)
+        self._max_samples = int(self._params.max_duration_secs * self._sample_rate)
+        self._ring = np.zeros(int(self._max_buffer_time * self._sample_rate), dtype=np.int16)
+        self._segment_buffer = np.zeros(self._max_samples, dtype=np.float32)
+        self._ring_read = 0
+        self._ring_write = 0
+        self._chunk_head = 0
+        self._chunk_tail = 0
+
     def append_audio(self, buffer: bytes, is_speech: bool) -> EndOfTurnState:
         """Append audio data for turn analysis.
 
@@ -106,47 +150,51 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         Returns:
             Current end-of-turn state after processing the audio.
         """
-        # Append the raw int16 PCM view to the buffer. Conversion to float32 is
+        # Copy the raw int16 PCM into the ring buffer. Conversion to float32 is
         # deferred until _process_speech_segment, where it runs once per turn
-        # on the concatenated segment instead of once per ~20 ms audio frame.
-        # Safe because InputAudioRawFrame.audio is typed `bytes` (immutable in
-        # Python); audio filters and mixers that "modify" a frame's audio do
-        # so by reassigning frame.audio to a new bytes object, never by
-        # mutating the buffer this view points at.
+        # on the extracted segment instead of once per ~20 ms audio frame.
+        now = time.monotonic()
         audio_int16 = np.frombuffer(buffer, dtype=np.int16)
-        self._audio_buffer.append((time.monotonic(), audio_int16))
+        self._append_chunk(now, self._ring_write)
+        self._write_ring(audio_int16)
 
         state = EndOfTurnState.INCOMPLETE
 
         if is_speech:
             # Reset silence tracking on speech
-            self._silence_ms = 0
+            self._silence_samples = 0
             self._speech_triggered = True
             if self._speech_start_time == 0:
-                self._speech_start_time = time.monotonic()
+                self._speech_start_time = now
         else:
             if self._speech_triggered:
-                chunk_duration_ms = len(audio_int16) / (self._sample_rate / 1000)
-                self._silence_ms += chunk_duration_ms
+                self._silence_samples += len(audio_int16)
                 # If silence exceeds threshold, mark end of turn
-                if self._silence_ms >= self._stop_ms:
+                if self._silence_samples >= self._stop_samples:
                     logger.debug(
-                        f"End of Turn complete due to stop_secs. Silence in ms: {self._silence_ms}"
+                        "End of Turn complete due to stop_secs. "
+                        f"Silence in ms: {self._silence_duration_ms()}"
                     )
                     state = EndOfTurnState.COMPLETE
                     self._clear(state)
             else:
-                # Trim buffer to prevent unbounded growth before speech
-                max_buffer_time = (
-                    (self._params.pre_speech_ms / 1000)
-                    + self._params.stop_secs
-                    + self._params.max_duration_secs
-                )
-                while (
-                    self._audio_buffer
-                    and self._audio_buffer[0][0] < time.monotonic() - max_buffer_time
-                ):
-                    self._audio_buffer.pop(0)
+                # Trim buffer to prevent unbounded growth before speech. Usually
+                # at most one chunk has expired, so check before searching.
+                cutoff = now - self._max_buffer_time
+                head = self._chunk_head
+                tail = self._chunk_tail
+                if self._chunk_times[head] < cutoff:
+                    if head + 1 < tail and self._chunk_times[head + 1] < cutoff:
+                        head += int(
+                            np.searchsorted(self._chunk_times[head:tail], cutoff, side="left")
+                        )
+                    else:
+                        head += 1
+                    self._chunk_head = head
+                    if head < tail:
+                        self._ring_read = max(self._ring_read, int(self._chunk_starts[head]))
+                    else:
+                        self._ring_read = self._ring_write
 
         return state
 
@@ -158,9 +206,7 @@ class BaseSmartTurn(BaseTurnAnalyzer):
             from the ML model analysis.
         """
         loop = asyncio.get_running_loop()
-        state, result = await loop.run_in_executor(
-            self._executor, self._process_speech_segment, self._audio_buffer
-        )
+        state, result = await loop.run_in_executor(self._executor, self._process_speech_segment)
         if state == EndOfTurnState.COMPLETE:
             self._clear(state)
         logger.debug(f"End of Turn result: {state}")
@@ -178,40 +224,118 @@ class BaseSmartTurn(BaseTurnAnalyzer):
         """Clear internal state based on turn completion status."""
         # If the state is still incomplete, keep the _speech_triggered as True
         self._speech_triggered = turn_state == EndOfTurnState.INCOMPLETE
-        self._audio_buffer = []
+        self._ring_read = 0
+        self._ring_write = 0
+        self._chunk_head = 0
+        self._chunk_tail = 0
         self._speech_start_time = 0
-        self._silence_ms = 0
-
-    def _process_speech_segment(self, audio_buffer) -> tuple[EndOfTurnState, MetricsData | None]:
+        self._silence_samples = 0
+
+    def _silence_duration_ms(self) -> int:
+        """Return the accumulated silence in milliseconds, for logging."""
+        return self._silence_samples * 1000 // self._sample_rate
+
+    def _write_ring(self, audio_int16: np.ndarray):
+        """Copy samples into the ring buffer, overwriting the oldest ones if full."""
+        capacity = len(self._ring)
+        count = len(audio_int16)
+        end = self._ring_write + count
+        if count > capacity:
+            audio_int16 = audio_int16[-capacity:]
+            count = capacity
+        pos = (end - count) % capacity
+        if pos + count <= capacity:
+            self._ring[pos : pos + count] = audio_int16
+        else:
+            first = capacity - pos
+            self._ring[pos:] = audio_int16[:first]
+            self._ring[: count - first] = audio_int16[first:]
+        self._ring_write = end
+        read = end - capacity
+        if read > self._ring_read:
+            self._ring_read = read
+            # Forget chunks that have been completely overwritten. Usually that
+            # is at most one, so check the next chunks before searching.
+            head = self._chunk_head
+            tail = self._chunk_tail
+            if head + 1 < tail and self._chunk_starts[head + 1] <= read:
+                if head + 2 < tail and self._chunk_starts[head + 2] <= read:
+                    overwritten = np.searchsorted(self._chunk_starts[head:tail], read, side="right")
+                    self._chunk_head = head + int(overwritten) - 1
+                else:
+                    self._chunk_head = head + 1
+
+    def _append_chunk(self, timestamp: float, first_sample: int):
+        """Record a new chunk, compacting or growing the chunk arrays if full."""
+        if self._chunk_tail == len(self._chunk_times):
+            count = self._chunk_tail - self._chunk_head
+            if count == len(self._chunk_times):
+                self._chunk_times = np.resize(self._chunk_times, 2 * count)
+                self._chunk_starts = np.resize(self._chunk_starts, 2 * count)
+            else:
+                live = slice(self._chunk_head, self._chunk_tail)
+                self._chunk_times[:count] = self._chunk_times[live]
+                self._chunk_starts[:count] = self._chunk_starts[live]
+            self._chunk_head = 0
+            self._chunk_tail = count
+        self._chunk_times[self._chunk_tail] = timestamp
+        self._chunk_starts[self._chunk_tail] = first_sample
+        self._chunk_tail += 1
+
+    def _ring_slices(self, start: int, end: int) -> tuple[np.ndarray, ...]:
+        """Return the ring views covering [start, end), two if the range wraps."""
+        capacity = len(self._ring)
+        pos = start % capacity
+        count = end - start
+        if pos + count <= capacity:
+            return (self._ring[pos : pos + count],)
+        return (self._ring[pos:], self._ring[: pos + count - capacity])
+
+    def _read_ring_float32(self, start: int, end: int) -> np.ndarray:
+        """Return the buffered samples in [start, end) normalized to float32.
+
+        Each ring view is cast and scaled straight into the preallocated
+        segment buffer, so the samples are read and written once with no int16
+        intermediate and no allocation. The range must not exceed the maximum
+        segment length, and the returned view is overwritten by the next call.
+        """
+        out = self._segment_buffer[: end - start]
+        offset = 0
+        for view in self._ring_slices(start, end):
+            np.multiply(
+                view,
+                INT16_TO_FLOAT32_SCALE,
+                out=out[offset : offset + len(view)],
+                casting="unsafe",
+            )
+            offset += len(view)
+        return out
+
+    def _process_speech_segment(self) -> tuple[EndOfTurnState, MetricsData | None]:
         """Process accumulated audio segment using ML model."""
         state = EndOfTurnState.INCOMPLETE
 
-        if not audio_buffer:
+        if self._chunk_head == self._chunk_tail:
             return state, None
 
         # Extract recent audio segment for prediction
-        effective_pre_speech_ms = self._params.pre_speech_ms + (self._vad_start_secs * 1000)
-        start_time = self._speech_start_time - (effective_pre_speech_ms / 1000)
-        start_index = 0
-        for i, (t, _) in enumerate(audio_buffer):
-            if t >= start_time:
-                start_index = i
-                break
-
-        end_index = len(audio_buffer) - 1
-
-        # Extract the audio segment. The buffer holds int16 PCM views; defer
-        # the float32 conversion until after concatenation so it runs once
-        # per turn instead of once per appended frame.
-        segment_chunks_int16 = [chunk for _, chunk in audio_buffer[start_index : end_index + 1]]
-        segment_audio_int16 = np.concatenate(segment_chunks_int16)
-        segment_audio = segment_audio_int16.astype(np.float32) / 32768.0
-
-        # Limit maximum duration
-        max_samples = int(self._params.max_duration_secs * self.sample_rate)
-        if len(segment_audio) > max_samples:
-            # slices the array to keep the last max_samples samples, discarding the earlier part.
-            segment_audio = segment_audio[-max_samples:]
+        start_time = self._speech_start_time - self._pre_speech_secs - self._vad_start_secs
+        start_index = self._chunk_head + int(
+            np.searchsorted(
+                self._chunk_times[self._chunk_head : self._chunk_tail], start_time, side="left"
+            )
+        )
+        start_sample = self._ring_read
+        if start_index < self._chunk_tail:
+            start_sample = max(int(self._chunk_starts[start_index]), self._ring_read)
+
+        # Limit maximum duration. Keep the last max_samples samples by moving
+        # the start forward before reading, so discarded audio is never copied.
+        start_sample = max(start_sample, self._ring_write - self._max_samples)
+
+        # Extract the audio segment. The ring holds int16 PCM; the float32
+        # conversion runs once per turn on the extracted segment.
+        segment_audio = self._read_ring_float32(start_sample, self._ring_write)
 
         result_data = None
 
@@ -244,17 +368,22 @@ class BaseSmartTurn(BaseTurnAnalyzer):
                 logger.trace(f"E2E processing time: {result_data.e2e_processing_time_ms:.2f}ms")
             except SmartTurnTimeoutException:
                 logger.debug(
-                    f"End of Turn complete due to stop_secs. Silence in ms: {self._silence_ms}"
+                    "End of Turn complete due to stop_secs. "
+                    f"Silence in ms: {self._silence_duration_ms()}"
                 )
                 state = EndOfTurnState.COMPLETE
 
         else:
-            logger.trace(f"params: {self._params}, stop_ms: {self._stop_ms}")
+            logger.trace(f"params: {self._params}, stop_samples: {self._stop_samples}")
             logger.trace("Captured empty audio segment, skipping prediction.")
 
         return state, result_data
 
     @abstractmethod
     def _predict_endpoint(self, audio_array: np.ndarray) -> dict[str, Any]:
-        """Predict end-of-turn using ML model from audio data."""
+        """Predict end-of-turn using ML model from audio data.
+
+        The audio array is reused for the next segment, so implementations
+        must copy it if they need it after returning.
+        """
         pass
@@ -10,6 +10,7 @@ This module provides a smart turn analyzer that uses an ONNX model for
 local end-of-turn detection without requiring network connectivity.
 """
 
+from functools import cache
 from typing import Any, cast
 
 import numpy as np
@@ -25,6 +26,29 @@ from pipecat.utils.env import env_truthy
 _MODEL_SAMPLE_RATE = 16000
 
 
+@cache
+def _load_session(smart_turn_model_path: str, cpu_count: int) -> ort.InferenceSession:
+    """Load the ONNX model, sharing one session per model path and CPU count.
+
+    Inference sessions are stateless and safe to run concurrently, so all
+    analyzers using the same model can share one instead of each bot paying
+    the model load time.
+    """
+    logger.debug(f"Loading Local Smart Turn v3.x model from {smart_turn_model_path}...")
+
+    so = ort.SessionOptions()
+    so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    so.inter_op_num_threads = 1
+    so.intra_op_num_threads = cpu_count
+    so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+    session = ort.InferenceSession(smart_turn_model_path, sess_options=so)
+
+    logger.debug("Loaded Local Smart Turn v3.x")
+
+    return session
+
+
 class LocalSmartTurnAnalyzerV3(BaseSmartTurn):
     """Local turn analyzer using the smart-turn-v3 ONNX model.
 
@@ -65,17 +89,7 @@ class LocalSmartTurnAnalyzerV3(BaseSmartTurn):
                         impresources.files(package_path).joinpath(model_name)
                     )
 
-        logger.debug(f"Loading Local Smart Turn v3.x model from {smart_turn_model_path}...")
-
-        so = ort.SessionOptions()
-        so.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
-        so.inter_op_num_threads = 1
-        so.intra_op_num_threads = cpu_count
-        so.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
-
-        self._session = ort.InferenceSession(smart_turn_model_path, sess_options=so)
-
-        logger.debug("Loaded Local Smart Turn v3.x")
+        self._session = _load_session(smart_turn_model_path, cpu_count)
 
     def _write_audio_to_wav(
         self, audio_array: np.ndarray, sample_rate: int = _MODEL_SAMPLE_RATE, suffix: str = ""
@@ -11,6 +11,7 @@ API. It supports real-time transcription with Voice Activity Detection (VAD) and
 can handle multiple audio formats for Indian language speech recognition.
 """
 
+import asyncio
 import base64
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
@@ -57,6 +58,29 @@ except ModuleNotFoundError as e:
     raise ImportError(f"Missing module: {e}") from e
 
 
+# Mapping of pipecat Language enum to Sarvam language codes
+_SARVAM_LANGUAGES: dict[Language, str] = {
+    Language.BN_IN: "bn-IN",
+    Language.GU_IN: "gu-IN",
+    Language.HI_IN: "hi-IN",
+    Language.KN_IN: "kn-IN",
+    Language.ML_IN: "ml-IN",
+    Language.MR_IN: "mr-IN",
+    Language.TA_IN: "ta-IN",
+    Language.TE_IN: "te-IN",
+    Language.PA_IN: "pa-IN",
+    Language.OR_IN: "od-IN",
+    Language.EN_IN: "en-IN",
+    Language.AS_IN: "as-IN",
+}
+
+# Mapping of language codes reported by Sarvam back to pipecat Language enum
+_SARVAM_LANGUAGE_CODES: dict[str, Language] = {
+    **{code: language for language, code in _SARVAM_LANGUAGES.items()},
+    "en-US": Language.EN_US,
+}
+
+
 def language_to_sarvam_language(language: Language) -> str:
     """Convert a Language enum to Sarvam's language code format.
 
@@ -66,23 +90,7 @@ def language_to_sarvam_language(language: Language) -> str:
     Returns:
         The Sarvam language code string.
     """
-    # Mapping of pipecat Language enum to Sarvam language codes
-    LANGUAGE_MAP = {
-        Language.BN_IN: "bn-IN",
-        Language.GU_IN: "gu-IN",
-        Language.HI_IN: "hi-IN",
-        Language.KN_IN: "kn-IN",
-        Language.ML_IN: "ml-IN",
-        Language.MR_IN: "mr-IN",
-        Language.TA_IN: "ta-IN",
-        Language.TE_IN: "te-IN",
-        Language.PA_IN: "pa-IN",
-        Language.OR_IN: "od-IN",
-        Language.EN_IN: "en-IN",
-        Language.AS_IN: "as-IN",
-    }
-
-    return resolve_language(language, LANGUAGE_MAP, use_base_code=False)
+    return resolve_language(language, _SARVAM_LANGUAGES, use_base_code=False)
 
 
 @dataclass(frozen=True)
@@ -385,6 +393,12 @@ class SarvamSTTService(STTService):
 
         # Store connection parameters
         self._input_audio_codec = input_audio_codec
+        # Convert input_audio_codec to encoding format (prepend "audio/" if needed)
+        self._encoding = (
+            input_audio_codec
+            if input_audio_codec.startswith("audio/")
+            else f"audio/{input_audio_codec}"
+        )
 
         # Initialize Sarvam SDK client
         self._sdk_headers = sdk_headers()
@@ -394,8 +408,17 @@ class SarvamSTTService(STTService):
         self._sarvam_client = AsyncSarvamAI(api_subscription_key=api_key, headers=self._sdk_headers)
         self._websocket_context = None
         self._socket_client = None
+        # Bound SDK send method (transcribe or translate), resolved on connect.
+        self._send_audio_method = None
+        # Sarvam language code of the current connection, resolved on connect.
+        self._language_string = None
         self._receive_task = None
 
+        # Messages are handed from the SDK callback to a single processing task
+        # so they are handled in order without spawning a task per message.
+        self._message_queue: asyncio.Queue[Any] = asyncio.Queue()
+        self._message_task = None
+
         if default_settings.vad_signals:
             self._register_event_handler("on_speech_started")
             self._register_event_handler("on_speech_stopped")
@@ -588,34 +611,26 @@ class SarvamSTTService(STTService):
             return
 
         try:
-            # Convert audio bytes to base64 for Sarvam API
-            audio_base64 = base64.b64encode(audio).decode("utf-8")
-
-            # Convert input_audio_codec to encoding format (prepend "audio/" if needed)
-            encoding = (
-                self._input_audio_codec
-                if self._input_audio_codec.startswith("audio/")
-                else f"audio/{self._input_audio_codec}"
-            )
-
-            # Build method arguments
-            method_kwargs = {
-                "audio": audio_base64,
-                "encoding": encoding,
-                "sample_rate": self.sample_rate,
-            }
-
-            # Use appropriate method based on model configuration
-            if self._config.use_translate_method:
-                await self._socket_client.translate(**method_kwargs)
-            else:
-                await self._socket_client.transcribe(**method_kwargs)
-
+            await self._send_audio(audio)
         except Exception as e:
             yield ErrorFrame(error=f"Error sending audio to Sarvam: {e}", exception=e)
 
         yield None
 
+    async def _send_audio(self, audio: bytes):
+        """Send raw audio bytes to Sarvam over the WebSocket.
+
+        Args:
+            audio: Raw audio bytes to send.
+        """
+        # The SDK only accepts base64 audio inside a JSON message. Base64 output
+        # is pure ASCII, so decode it as such.
+        audio_base64 = base64.b64encode(audio).decode("ascii")
+
+        await self._send_audio_method(
+            audio=audio_base64, encoding=self._encoding, sample_rate=self.sample_rate
+        )
+
     async def _connect(self):
         """Connect to Sarvam WebSocket API using the SDK."""
         logger.debug("Connecting to Sarvam")
@@ -659,9 +674,9 @@ class SarvamSTTService(STTService):
                         connect_kwargs[k] = str(v)
 
             # Add language_code for models that support it
-            language_string = self._get_language_string()
-            if language_string is not None:
-                connect_kwargs["language_code"] = language_string
+            self._language_string = self._get_language_string()
+            if self._language_string is not None:
+                connect_kwargs["language_code"] = self._language_string
 
             # Add mode for models that support it
             if self._config.supports_mode and self._mode is not None:
@@ -716,6 +731,13 @@ class SarvamSTTService(STTService):
             # Enter the async context manager
             self._socket_client = await self._websocket_context.__aenter__()
 
+            # Use appropriate method based on model configuration
+            self._send_audio_method = (
+                self._socket_client.translate
+                if self._config.use_translate_method
+                else self._socket_client.transcribe
+            )
+
             # Fallback for SDKs that support runtime prompt updates.
             if self._settings.prompt is not None and self._config.supports_prompt:
                 prompt_setter = getattr(self._socket_client, "set_prompt", None)
@@ -724,12 +746,15 @@ class SarvamSTTService(STTService):
 
             # Register event handler for incoming messages
             def _message_handler(message):
-                """Wrapper to handle async response handler."""
-                # Use Pipecat's built-in task management
-                self.create_task(self._handle_message(message))
+                """Queue the message for the message processing task."""
+                self._message_queue.put_nowait(message)
 
             self._socket_client.on(EventType.MESSAGE, _message_handler)
 
+            # Start message processing task using Pipecat's task management
+            if not self._message_task:
+                self._message_task = self.create_task(self._message_task_handler())
+
             # Start receive task using Pipecat's task management
             self._receive_task = self.create_task(self._receive_task_handler())
 
@@ -739,10 +764,12 @@ class SarvamSTTService(STTService):
 
         except ApiError as e:
             self._socket_client = None
+            self._send_audio_method = None
             self._websocket_context = None
             await self.push_error(error_msg=f"Sarvam API error: {e}", exception=e)
         except Exception as e:
             self._socket_client = None
+            self._send_audio_method = None
             self._websocket_context = None
             await self.push_error(error_msg=f"Failed to connect to Sarvam: {e}", exception=e)
 
@@ -754,11 +781,16 @@ class SarvamSTTService(STTService):
             await self.cancel_task(self._receive_task)
             self._receive_task = None
 
+        if self._message_task:
+            await self.cancel_task(self._message_task)
+            self._message_task = None
+
         # Clear references first to prevent run_stt from sending audio
         # during the close handshake.
         socket_client = self._socket_client
         websocket_context = self._websocket_context
         self._socket_client = None
+        self._send_audio_method = None
         self._websocket_context = None
 
         if websocket_context and socket_client:
@@ -782,11 +814,17 @@ class SarvamSTTService(STTService):
 
         try:
             # Start listening for messages from the Sarvam SDK
-            # Messages will be handled via the _message_handler callback
+            # Messages will be queued via the _message_handler callback
             await self._socket_client.start_listening()
         except Exception as e:
             await self.push_error(error_msg=f"Sarvam receive task error: {e}", exception=e)
 
+    async def _message_task_handler(self):
+        """Process queued messages from the Sarvam WebSocket in the order received."""
+        while True:
+            message = await self._message_queue.get()
+            await self._handle_message(message)
+
     async def _handle_message(self, message):
         """Handle incoming WebSocket message from Sarvam SDK.
 
@@ -795,7 +833,9 @@ class SarvamSTTService(STTService):
         Args:
             message: The parsed response object from Sarvam WebSocket.
         """
-        logger.debug(f"Received response: {message}")
+        # Pass the message as an argument so its repr is only built when trace
+        # logging is enabled.
+        logger.trace("Received response: {}", message)
 
         try:
             if message.type == "events":
@@ -822,12 +862,10 @@ class SarvamSTTService(STTService):
                 # Prefer language from message (auto-detected for translate models). Fallback to configured.
                 if language_code:
                     language = self._map_language_code_to_enum(language_code)
+                elif self._language_string:
+                    language = self._map_language_code_to_enum(self._language_string)
                 else:
-                    language_string = self._get_language_string()
-                    if language_string:
-                        language = self._map_language_code_to_enum(language_string)
-                    else:
-                        language = Language.HI_IN
+                    language = Language.HI_IN
 
                 # Emit utterance end event
                 await self._call_event_handler("on_utterance_end")
@@ -844,7 +882,7 @@ class SarvamSTTService(STTService):
                             self._user_id,
                             time_now_iso8601(),
                             language,
-                            result=(message.dict() if hasattr(message, "dict") else str(message)),
+                            result=message,
                         )
                     )
 
@@ -866,22 +904,7 @@ class SarvamSTTService(STTService):
 
     def _map_language_code_to_enum(self, language_code: str) -> Language:
         """Map Sarvam language code to pipecat Language enum."""
-        mapping = {
-            "bn-IN": Language.BN_IN,
-            "gu-IN": Language.GU_IN,
-            "hi-IN": Language.HI_IN,
-            "kn-IN": Language.KN_IN,
-            "ml-IN": Language.ML_IN,
-            "mr-IN": Language.MR_IN,
-            "ta-IN": Language.TA_IN,
-            "te-IN": Language.TE_IN,
-            "pa-IN": Language.PA_IN,
-            "od-IN": Language.OR_IN,
-            "en-US": Language.EN_US,
-            "en-IN": Language.EN_IN,
-            "as-IN": Language.AS_IN,
-        }
-        return mapping.get(language_code, Language.HI_IN)
+        return _SARVAM_LANGUAGE_CODES.get(language_code, Language.HI_IN)
 
     def _is_keepalive_ready(self) -> bool:
         """Check if the Sarvam SDK websocket client is connected."""
@@ -893,21 +916,7 @@ class SarvamSTTService(STTService):
         Args:
             silence: Silent 16-bit mono PCM audio bytes.
         """
-        audio_base64 = base64.b64encode(silence).decode("utf-8")
-        encoding = (
-            self._input_audio_codec
-            if self._input_audio_codec.startswith("audio/")
-            else f"audio/{self._input_audio_codec}"
-        )
-        method_kwargs = {
-            "audio": audio_base64,
-            "encoding": encoding,
-            "sample_rate": self.sample_rate,
-        }
-        if self._config.use_translate_method:
-            await self._socket_client.translate(**method_kwargs)
-        else:
-            await self._socket_client.transcribe(**method_kwargs)
+        await self._send_audio(silence)
 
     async def _start_metrics(self):
         """Start processing metrics collection."""
@@ -15,11 +15,13 @@ text-to-speech synthesis using local Docker deployment.
     local TTS services. Will be removed in 2.0.0.
 """
 
+import json
 from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
+import numpy as np
 from loguru import logger
 
 from pipecat.audio.utils import create_stream_resampler
@@ -42,6 +44,9 @@ from pipecat.utils.tracing.service_decorators import traced_tts
 # You can find more information on the official repo:
 # https://github.com/coqui-ai/xtts-streaming-server
 
+# Characters stripped from the input text before synthesis.
+_TEXT_STRIP_TABLE = str.maketrans("", "", ".*")
+
 
 def language_to_xtts_language(language: Language) -> str:
     """Convert a Language enum to XTTS language code.
@@ -171,6 +176,8 @@ class XTTSService(TTSService):
         self._base_url = base_url
 
         self._studio_speakers: dict[str, Any] | None = None
+        # Serialized speaker fields of the request body, keyed by voice.
+        self._speaker_payloads: dict[str, str] = {}
         self._aiohttp_session = aiohttp_session
 
         self._resampler = create_stream_resampler()
@@ -212,7 +219,43 @@ class XTTSService(TTSService):
                     error_msg=f"Error getting studio speakers (status: {r.status}, error: {text})"
                 )
                 return
-            self._studio_speakers = await r.json()
+            studio_speakers = await r.json()
+
+        # Keep the embeddings as packed arrays rather than lists of Python floats,
+        # which take about four times the memory. float64 keeps the values exact.
+        self._studio_speakers = {
+            name: {
+                "speaker_embedding": np.asarray(speaker["speaker_embedding"], dtype=np.float64),
+                "gpt_cond_latent": np.asarray(speaker["gpt_cond_latent"], dtype=np.float64),
+            }
+            for name, speaker in studio_speakers.items()
+        }
+
+    def _get_speaker_payload(self, voice: str, embeddings: dict[str, Any]) -> str:
+        """Return the serialized speaker fields of the request body for a voice.
+
+        The speaker embeddings hold thousands of floats, so they are encoded
+        to JSON once per voice rather than on every request.
+
+        Args:
+            voice: The studio speaker to synthesize with.
+            embeddings: The studio speaker's embeddings.
+
+        Returns:
+            The speaker fields as a JSON object body without its enclosing braces.
+        """
+        speaker_payload = self._speaker_payloads.get(voice)
+        if speaker_payload is None:
+            speaker_payload = json.dumps(
+                {
+                    "speaker_embedding": embeddings["speaker_embedding"].tolist(),
+                    "gpt_cond_latent": embeddings["gpt_cond_latent"].tolist(),
+                    "add_wav_header": False,
+                    "stream_chunk_size": 20,
+                }
+            )[1:-1]
+            self._speaker_payloads[voice] = speaker_payload
+        return speaker_payload
 
     @traced_tts
     async def run_tts(self, text: str, context_id: str) -> AsyncGenerator[Frame, None]:
@@ -233,20 +276,21 @@ class XTTSService(TTSService):
         if voice is None:
             yield ErrorFrame(error="XTTS voice must be specified")
             return
-        embeddings = self._studio_speakers[voice]
+        speaker_payload = self._get_speaker_payload(voice, self._studio_speakers[voice])
 
         url = self._base_url + "/tts_stream"
 
-        payload = {
-            "text": text.replace(".", "").replace("*", ""),
-            "language": self._settings.language,
-            "speaker_embedding": embeddings["speaker_embedding"],
-            "gpt_cond_latent": embeddings["gpt_cond_latent"],
-            "add_wav_header": False,
-            "stream_chunk_size": 20,
-        }
+        text_payload = json.dumps(
+            {
+                "text": text.translate(_TEXT_STRIP_TABLE),
+                "language": self._settings.language,
+            }
+        )
+        payload = f"{text_payload[:-1]}, {speaker_payload}}}".encode()
 
-        async with self._aiohttp_session.post(url, json=payload) as r:
+        async with self._aiohttp_session.post(
+            url, data=payload, headers={"Content-Type": "application/json"}
+        ) as r:
             if r.status != 200:
                 text = await r.text()
                 yield ErrorFrame(error=f"Error getting audio (status: {r.status}, error: {text})")
@@ -256,7 +300,10 @@ class XTTSService(TTSService):
 
             CHUNK_SIZE = self.chunk_size
 
+            # Consumed audio is tracked with a read offset and compacted once per
+            # network chunk, instead of re-allocating the buffer on every slice.
             buffer = bytearray()
+            read_pos = 0
             async for chunk in r.content.iter_chunked(CHUNK_SIZE):
                 if len(chunk) > 0:
                     await self.stop_ttfb_metrics()
@@ -265,16 +312,16 @@ class XTTSService(TTSService):
 
                     # Check if buffer has enough data for processing.
                     while (
-                        len(buffer) >= 48000
+                        len(buffer) - read_pos >= 48000
                     ):  # Assuming at least 0.5 seconds of audio data at 24000 Hz
                         # Process the buffer up to a safe size for resampling.
-                        process_data = buffer[:48000]
-                        # Remove processed data from buffer.
-                        buffer = buffer[48000:]
+                        with memoryview(buffer) as view:
+                            process_data = bytes(view[read_pos : read_pos + 48000])
+                        read_pos += 48000
 
                         # XTTS uses 24000 so we need to resample to our desired rate.
                         resampled_audio = await self._resampler.resample(
-                            bytes(process_data), 24000, self.sample_rate
+                            process_data, 24000, self.sample_rate
                         )
                         # Create the frame with the resampled audio
                         frame = TTSAudioRawFrame(
@@ -282,6 +329,11 @@ class XTTSService(TTSService):
                         )
                         yield frame
 
+                    # Remove processed data from buffer.
+                    if read_pos:
+                        del buffer[:read_pos]
+                        read_pos = 0
+
             # Process any remaining data in the buffer.
             if len(buffer) > 0:
                 resampled_audio = await self._resampler.resample(
@@ -6,14 +6,15 @@
 
 """Tests for BaseSmartTurn's audio buffer behavior.
 
-The buffer holds int16 PCM views and defers the float32 conversion to
-_process_speech_segment so it runs once per turn instead of once per
+The buffer is a preallocated int16 ring and defers the float32 conversion
+to _process_speech_segment so it runs once per turn instead of once per
 appended audio frame. These tests verify:
 
-  1. The deferred float32 segment is bit-identical to the eager version that
-     converted each chunk in append_audio.
+  1. The float32 segment read from the ring is bit-identical to the eager
+     version that converted each chunk in append_audio.
   2. The pre-speech trim loop still bounds buffer size when no speech ever
      triggers.
+  3. The ring keeps the most recent audio once it wraps around.
 """
 
 import time
@@ -49,46 +50,53 @@ def _pcm_bytes(values: np.ndarray) -> bytes:
 
 
 def test_segment_matches_eager_conversion_bit_identical():
-    """The deferred segment must be bit-identical to per-chunk conversion.
+    """The segment read from the ring must be bit-identical to per-chunk conversion.
 
-    For ``int16 -> float32 / 32768.0`` the two orderings (cast-each-then-concat
-    vs concat-then-cast) are equivalent element-wise: the cast is per-element
-    and the divide is multiplication by a float constant, so concatenation
-    distributes through both. We assert this concretely so that any future
-    code change to the conversion pipeline cannot silently shift outputs.
+    The analyzer converts int16 ring views straight into its float32 segment
+    buffer when a turn is analyzed. Compare that against converting each chunk
+    in isolation with ``astype(np.float32) / 32768.0``, as append_audio used to,
+    so any change to the conversion pipeline cannot silently shift outputs.
     """
     rng = np.random.default_rng(seed=1234)
     chunk_size = 320  # 20 ms @ 16 kHz
     n_chunks = 12
     chunks_int16 = [
-        rng.integers(-32768, 32767, size=chunk_size, dtype=np.int16) for _ in range(n_chunks)
+        rng.integers(-32768, 32767, size=chunk_size, dtype=np.int16, endpoint=True)
+        for _ in range(n_chunks)
     ]
+    # Make sure the extremes of the int16 range are exercised.
+    chunks_int16[0][:2] = [-32768, 32767]
 
-    # Eager: convert each chunk to float32 in isolation, then concatenate.
-    eager_float32_chunks = [c.astype(np.float32) / 32768.0 for c in chunks_int16]
-    eager_segment = np.concatenate(eager_float32_chunks)
-
-    # Deferred (what _process_speech_segment now does): concatenate int16, then cast.
-    deferred_segment = np.concatenate(chunks_int16).astype(np.float32) / 32768.0
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=SmartTurnParams())
+    analyzer.set_sample_rate(16_000)
+    analyzer._speech_start_time = time.monotonic()
+    for chunk in chunks_int16:
+        analyzer.append_audio(_pcm_bytes(chunk), is_speech=True)
+    analyzer._process_speech_segment()
 
-    assert deferred_segment.dtype == np.float32
-    assert eager_segment.shape == deferred_segment.shape
-    # Bit-identical, not just close: this is a structural property of the
-    # operation, not an approximation. Use array_equal to fail loudly if it
+    # Eager: convert each chunk to float32 in isolation, then concatenate.
+    eager_segment = np.concatenate([c.astype(np.float32) / 32768.0 for c in chunks_int16])
+
+    segment = analyzer.captured_segment
+    assert segment is not None
+    assert segment.dtype == np.float32
+    assert segment.shape == eager_segment.shape
+    # Bit-identical, not just close: scaling by the exact power-of-two
+    # reciprocal matches the divide. Use array_equal to fail loudly if it
     # ever becomes "merely close".
-    assert np.array_equal(eager_segment, deferred_segment)
+    assert np.array_equal(segment, eager_segment)
 
 
-def test_buffer_holds_int16_views_after_append():
-    """After append_audio, _audio_buffer entries should be int16, not float32."""
+def test_buffer_holds_int16_samples_after_append():
+    """After append_audio, the ring should hold the raw int16 samples."""
     analyzer = _RecordingSmartTurn(sample_rate=16_000, params=SmartTurnParams())
     analyzer.set_sample_rate(16_000)
     chunk = np.array([100, -200, 300, -400], dtype=np.int16)
     analyzer.append_audio(_pcm_bytes(chunk), is_speech=True)
 
-    assert len(analyzer._audio_buffer) == 1
-    _, stored = analyzer._audio_buffer[0]
-    assert stored.dtype == np.int16
+    assert analyzer._chunk_tail - analyzer._chunk_head == 1
+    assert analyzer._ring.dtype == np.int16
+    stored = np.concatenate(analyzer._ring_slices(analyzer._ring_read, analyzer._ring_write))
     np.testing.assert_array_equal(stored, chunk)
 
 
@@ -124,7 +132,7 @@ def test_segment_audio_is_normalized_float32():
     for _ in range(4):
         analyzer2.append_audio(_pcm_bytes(speech), is_speech=True)
 
-    state, _metrics = analyzer2._process_speech_segment(analyzer2._audio_buffer)
+    state, _metrics = analyzer2._process_speech_segment()
     assert analyzer2.captured_segment is not None
     assert analyzer2.captured_segment.dtype == np.float32
     assert float(np.max(np.abs(analyzer2.captured_segment))) <= 1.0
@@ -149,7 +157,74 @@ def test_pre_speech_buffer_trim_still_bounds_growth():
     # max_buffer_time is 0.1 + 0.2 + 0.5 = 0.8 s; at 50 Hz that caps the buffer
     # well below 50 entries. We're conservative — anything < 50 proves the
     # trim ran.
-    assert len(analyzer._audio_buffer) < 50
+    assert analyzer._chunk_tail - analyzer._chunk_head < 50
+    assert analyzer._ring_read == analyzer._chunk_starts[analyzer._chunk_head]
+
+
+def test_pre_speech_trim_drops_several_expired_chunks():
+    """After a gap longer than the buffer window, all older chunks are trimmed at once."""
+    params = SmartTurnParams(pre_speech_ms=0, stop_secs=0.0, max_duration_secs=0.1)
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=params)
+    analyzer.set_sample_rate(16_000)
+
+    chunk = np.zeros(160, dtype=np.int16)
+    for _ in range(5):
+        analyzer.append_audio(_pcm_bytes(chunk), is_speech=False)
+    assert analyzer._chunk_tail - analyzer._chunk_head == 5
+
+    time.sleep(0.15)
+    analyzer.append_audio(_pcm_bytes(chunk), is_speech=False)
+
+    assert analyzer._chunk_tail - analyzer._chunk_head == 1
+    assert analyzer._ring_read == analyzer._chunk_starts[analyzer._chunk_head]
+    assert analyzer._ring_write - analyzer._ring_read == len(chunk)
+
+
+def test_ring_wraparound_keeps_most_recent_audio():
+    """Once the ring is full, the segment must contain the newest samples in order."""
+    params = SmartTurnParams(pre_speech_ms=0, stop_secs=0.0, max_duration_secs=0.1)
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=params)
+    analyzer.set_sample_rate(16_000)
+    capacity = len(analyzer._ring)
+    assert capacity == 1_600
+
+    chunk_size = 300  # does not divide the capacity, so chunks straddle the wrap
+    analyzer._speech_start_time = time.monotonic()
+    samples = np.arange(20 * chunk_size, dtype=np.int16)
+    for i in range(20):
+        chunk = samples[i * chunk_size : (i + 1) * chunk_size]
+        analyzer.append_audio(_pcm_bytes(chunk), is_speech=True)
+
+    assert analyzer._ring_write - analyzer._ring_read == capacity
+    analyzer._process_speech_segment()
+    assert analyzer.captured_segment is not None
+    expected = samples[-capacity:].astype(np.float32) / 32768.0
+    np.testing.assert_array_equal(analyzer.captured_segment, expected)
+
+
+def test_overwritten_chunks_are_forgotten():
+    """Chunks whose samples were fully overwritten must leave the chunk index."""
+    params = SmartTurnParams(pre_speech_ms=0, stop_secs=0.0, max_duration_secs=0.1)
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=params)
+    analyzer.set_sample_rate(16_000)
+    capacity = len(analyzer._ring)
+
+    analyzer._speech_start_time = time.monotonic()
+    for _ in range(8):
+        analyzer.append_audio(_pcm_bytes(np.zeros(200, dtype=np.int16)), is_speech=True)
+    assert analyzer._chunk_head == 0
+
+    # One more small chunk overwrites exactly the oldest chunk.
+    analyzer.append_audio(_pcm_bytes(np.zeros(200, dtype=np.int16)), is_speech=True)
+    assert analyzer._chunk_head == 1
+
+    # A large chunk overwrites several chunks at once, keeping only the chunk
+    # that still straddles the read position.
+    analyzer.append_audio(_pcm_bytes(np.zeros(1_000, dtype=np.int16)), is_speech=True)
+    assert analyzer._ring_read == analyzer._ring_write - capacity
+    head = analyzer._chunk_head
+    assert analyzer._chunk_starts[head] <= analyzer._ring_read
+    assert analyzer._chunk_starts[head + 1] > analyzer._ring_read
 
 
 def test_clear_prevents_stale_stop_secs_completion():
@@ -204,7 +279,55 @@ def test_clear_drops_pre_clear_audio_from_next_segment():
     for _ in range(4):
         analyzer.append_audio(_pcm_bytes(new), is_speech=True)
 
-    analyzer._process_speech_segment(analyzer._audio_buffer)
+    analyzer._process_speech_segment()
     assert analyzer.captured_segment is not None
     # Only the post-clear constant may appear in the segment.
     assert np.allclose(analyzer.captured_segment, 2_000 / 32768.0)
+
+
+def test_chunk_index_grows_past_initial_capacity():
+    """Tracking more chunks than the initial capacity must not lose any audio."""
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=SmartTurnParams())
+    analyzer.set_sample_rate(16_000)
+    n_chunks = 3 * len(analyzer._chunk_times)
+
+    analyzer._speech_start_time = time.monotonic()
+    samples = np.arange(2 * n_chunks, dtype=np.int16)
+    for i in range(n_chunks):
+        analyzer.append_audio(_pcm_bytes(samples[2 * i : 2 * i + 2]), is_speech=True)
+
+    assert analyzer._chunk_tail - analyzer._chunk_head == n_chunks
+    analyzer._process_speech_segment()
+    assert analyzer.captured_segment is not None
+    np.testing.assert_array_equal(analyzer.captured_segment, samples.astype(np.float32) / 32768.0)
+
+
+def test_segment_is_limited_to_max_duration():
+    """Only the last max_duration_secs of audio may reach _predict_endpoint."""
+    params = SmartTurnParams(pre_speech_ms=0, max_duration_secs=0.1)
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=params)
+    analyzer.set_sample_rate(16_000)
+
+    analyzer._speech_start_time = time.monotonic()
+    samples = np.arange(10 * 320, dtype=np.int16)
+    for i in range(10):
+        analyzer.append_audio(_pcm_bytes(samples[i * 320 : (i + 1) * 320]), is_speech=True)
+
+    analyzer._process_speech_segment()
+    assert analyzer.captured_segment is not None
+    expected = samples[-1_600:].astype(np.float32) / 32768.0
+    np.testing.assert_array_equal(analyzer.captured_segment, expected)
+
+
+def test_segment_reuses_preallocated_float32_buffer():
+    """Reading a segment must write into the analyzer's segment buffer, not allocate."""
+    analyzer = _RecordingSmartTurn(sample_rate=16_000, params=SmartTurnParams())
+    analyzer.set_sample_rate(16_000)
+    chunk = np.full(320, 8_000, dtype=np.int16)
+    analyzer.append_audio(_pcm_bytes(chunk), is_speech=True)
+
+    first = analyzer._read_ring_float32(analyzer._ring_read, analyzer._ring_write)
+    second = analyzer._read_ring_float32(analyzer._ring_read, analyzer._ring_write)
+    assert np.shares_memory(first, analyzer._segment_buffer)
+    assert np.shares_memory(first, second)
+    assert np.allclose(second, 8_000 / 32768.0)
@@ -0,0 +1,36 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Tests that Smart Turn v3 analyzers share the loaded ONNX session."""
+
+import pytest
+
+ort = pytest.importorskip("onnxruntime")  # noqa: F841 -- needed by LocalSmartTurnAnalyzerV3
+
+from pipecat.audio.turn.smart_turn.local_smart_turn_v3 import (  # noqa: E402
+    LocalSmartTurnAnalyzerV3,
+)
+
+
+def test_analyzers_share_session_but_not_state():
+    """A second analyzer must reuse the model session while keeping its own buffers."""
+    first = LocalSmartTurnAnalyzerV3(sample_rate=16_000)
+    second = LocalSmartTurnAnalyzerV3(sample_rate=16_000)
+
+    assert first._session is second._session
+    assert first._executor is not second._executor
+
+    first.set_sample_rate(16_000)
+    second.set_sample_rate(16_000)
+    assert first._ring is not second._ring
+
+
+def test_different_cpu_count_loads_separate_session():
+    """Sessions are keyed by CPU count, since it is baked into the session options."""
+    one = LocalSmartTurnAnalyzerV3(sample_rate=16_000, cpu_count=1)
+    two = LocalSmartTurnAnalyzerV3(sample_rate=16_000, cpu_count=2)
+
+    assert one._session is not two._session
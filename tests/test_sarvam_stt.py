@@ -0,0 +1,182 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+import asyncio
+import base64
+import contextlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+pytest.importorskip("sarvamai")
+
+from sarvamai.core.events import EventType  # noqa: E402
+
+from pipecat.frames.frames import TranscriptionFrame  # noqa: E402
+from pipecat.services.sarvam.stt import SarvamSTTService  # noqa: E402
+from pipecat.transcriptions.language import Language  # noqa: E402
+
+
+class _FakeSocketClient:
+    """Stands in for the Sarvam SDK streaming socket client."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.transcribe = AsyncMock()
+        self.translate = AsyncMock()
+        self.flush = AsyncMock()
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, message):
+        self.handlers[EventType.MESSAGE](message)
+
+    async def start_listening(self):
+        # Messages are injected with emit(); just stay connected until cancelled.
+        await asyncio.Event().wait()
+
+
+class _FakeConnection:
+    def __init__(self, socket_client: _FakeSocketClient):
+        self.socket_client = socket_client
+
+    async def __aenter__(self):
+        return self.socket_client
+
+    async def __aexit__(self, *args):
+        return False
+
+
+def _make_service(**kwargs) -> tuple[SarvamSTTService, list[_FakeSocketClient], list[str]]:
+    """Build a SarvamSTTService whose SDK client hands out fake socket clients.
+
+    Returns the service, the socket clients created by each connect, and the
+    names of the coroutines started through create_task.
+    """
+    service = SarvamSTTService(api_key="test-key", sample_rate=16000, **kwargs)
+    service._sample_rate = 16000
+
+    socket_clients: list[_FakeSocketClient] = []
+
+    def connect(**connect_kwargs):
+        socket_client = _FakeSocketClient()
+        socket_clients.append(socket_client)
+        return _FakeConnection(socket_client)
+
+    service._sarvam_client = MagicMock()
+    service._sarvam_client.speech_to_text_streaming.connect = MagicMock(side_effect=connect)
+    service._sarvam_client.speech_to_text_translate_streaming.connect = MagicMock(
+        side_effect=connect
+    )
+
+    started: list[str] = []
+
+    def create_task(coro, name=None):
+        started.append(coro.__name__)
+        return asyncio.create_task(coro)
+
+    async def cancel_task(task, timeout=None):
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+    service.create_task = create_task
+    service.cancel_task = cancel_task
+    service.push_error = AsyncMock()
+    return service, socket_clients, started
+
+
+def _data_message(transcript: str):
+    return SimpleNamespace(
+        type="data", data=SimpleNamespace(transcript=transcript, language_code="hi-IN")
+    )
+
+
+@pytest.mark.asyncio
+async def test_messages_are_handled_in_callback_order():
+    service, socket_clients, _ = _make_service()
+    transcripts = []
+
+    async def push_frame(frame, direction=None):
+        if isinstance(frame, TranscriptionFrame):
+            # The first transcript takes longest to push; with one task per
+            # message the later ones would overtake it.
+            await asyncio.sleep(0.02 if frame.text == "one" else 0)
+            transcripts.append(frame.text)
+
+    service.push_frame = push_frame
+
+    await service._connect()
+    for text in ("one", "two", "three"):
+        socket_clients[0].emit(_data_message(text))
+
+    for _ in range(100):
+        if len(transcripts) == 3:
+            break
+        await asyncio.sleep(0.01)
+
+    assert transcripts == ["one", "two", "three"]
+    await service._disconnect()
+
+
+@pytest.mark.asyncio
+async def test_message_task_lifecycle_across_reconnect():
+    service, socket_clients, started = _make_service()
+
+    await service._connect()
+    first_task = service._message_task
+    assert first_task is not None
+    assert started.count("_message_task_handler") == 1
+
+    await service._disconnect()
+    assert service._message_task is None
+    assert first_task.done()
+
+    # A language change reconnects, which must start exactly one new consumer.
+    await service._connect()
+    await service._update_settings(SarvamSTTService.Settings(language=Language.EN_IN))
+    assert len(socket_clients) == 3
+    assert started.count("_message_task_handler") == 3
+    assert service._message_task is not None
+    assert not service._message_task.done()
+    running = [
+        task
+        for task in asyncio.all_tasks()
+        if task.get_coro().__name__ == "_message_task_handler" and not task.done()
+    ]
+    assert running == [service._message_task]
+
+    await service._disconnect()
+    assert service._message_task is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "model, method",
+    [("saarika:v2.5", "transcribe"), ("saaras:v3", "transcribe"), ("saaras:v2.5", "translate")],
+)
+async def test_send_audio_uses_model_method_and_encoding(model, method):
+    service, socket_clients, _ = _make_service(
+        settings=SarvamSTTService.Settings(model=model), input_audio_codec="wav"
+    )
+
+    await service._connect()
+    audio = b"\x01\x02" * 160
+    await service._send_audio(audio)
+
+    socket_client = socket_clients[0]
+    other = "translate" if method == "transcribe" else "transcribe"
+    getattr(socket_client, other).assert_not_awaited()
+    getattr(socket_client, method).assert_awaited_once_with(
+        audio=base64.b64encode(audio).decode("ascii"),
+        encoding="audio/wav",
+        sample_rate=16000,
+    )
+
+    await service._disconnect()
+    assert service._send_audio_method is None
@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2024-2026, Daily
+#
+# SPDX-License-Identifier: BSD 2-Clause License
+#
+
+"""Tests for XTTSService."""
+
+import json
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from pipecat.frames.frames import TTSAudioRawFrame, TTSSpeakFrame
+from pipecat.services.xtts.tts import XTTSService
+from pipecat.tests.utils import run_test
+
+STUDIO_SPEAKERS = {
+    "Claribel Dervla": {
+        "speaker_embedding": [0.125, -0.5, 1e-07, 3.0],
+        "gpt_cond_latent": [[0.1, -0.2], [0.30000000000000004, 4.5]],
+    },
+}
+
+
+@pytest.mark.asyncio
+async def test_run_xtts_request_body(aiohttp_client):
+    """The spliced request body must decode to the payload the server expects."""
+    text = 'She said "héllo" to 你好 *twice*.'
+    requests = []
+
+    async def studio_speakers_handler(request):
+        return web.json_response(STUDIO_SPEAKERS)
+
+    async def tts_stream_handler(request):
+        requests.append((request.content_type, await request.read()))
+        return web.Response(body=b"\x00\x01" * 24000, content_type="audio/raw")
+
+    app = web.Application()
+    app.router.add_get("/studio_speakers", studio_speakers_handler)
+    app.router.add_post("/tts_stream", tts_stream_handler)
+    client = await aiohttp_client(app)
+
+    base_url = str(client.make_url("")).rstrip("/")
+
+    async with aiohttp.ClientSession() as session:
+        tts_service = XTTSService(
+            base_url=base_url,
+            aiohttp_session=session,
+            sample_rate=24000,
+            settings=XTTSService.Settings(voice="Claribel Dervla"),
+        )
+
+        frames_received = await run_test(
+            tts_service,
+            frames_to_send=[TTSSpeakFrame(text=text), TTSSpeakFrame(text=text)],
+        )
+
+    audio_frames = [f for f in frames_received[0] if isinstance(f, TTSAudioRawFrame)]
+    assert audio_frames
+
+    # Both requests (the second one uses the cached speaker payload) must match
+    # what was sent before as `json=payload`.
+    expected = {
+        "text": text.replace(".", "").replace("*", ""),
+        "language": "en",
+        "speaker_embedding": STUDIO_SPEAKERS["Claribel Dervla"]["speaker_embedding"],
+        "gpt_cond_latent": STUDIO_SPEAKERS["Claribel Dervla"]["gpt_cond_latent"],
+        "add_wav_header": False,
+        "stream_chunk_size": 20,
+    }
+    assert len(requests) == 2
+    for content_type, body in requests:
+        assert content_type == "application/json"
+        assert json.loads(body) == expected